@@ -1,8 +1,15 @@
 from __future__ import annotations
 from dataclasses import dataclass, asdict
 from pathlib import Path
+import copy
 import yaml
 
+# libyaml-backed parser/emitter when available (much faster than pure Python).
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 from .paths import config_path, user_config_dir
 
 DEFAULT_CONFIG = {
@@ -18,24 +25,38 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Last merged config, keyed by the file's (mtime, size); callers always get a
+# deep copy. Size catches a rewrite landing within the same mtime tick.
+_cfg_cache: dict = {"key": None, "data": None}
+
 def load_config() -> dict:
     p = config_path()
-    if not p.exists():
+    try:
+        st = p.stat()
+    except FileNotFoundError:
         save_config(DEFAULT_CONFIG)
-        return dict(DEFAULT_CONFIG)
+        return copy.deepcopy(DEFAULT_CONFIG)
+    key = (st.st_mtime_ns, st.st_size)
+    if key == _cfg_cache["key"]:
+        return copy.deepcopy(_cfg_cache["data"])
+
     with p.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_Loader) or {}
     # merge defaults (shallow + nested)
     merged = dict(DEFAULT_CONFIG)
     merged.update({k: v for k, v in data.items() if k in merged})
     for nk in ("touch_rules", "notifications"):
         merged[nk] = dict(DEFAULT_CONFIG[nk])
         merged[nk].update((data.get(nk) or {}))
-    return merged
+
+    _cfg_cache["key"] = key
+    _cfg_cache["data"] = merged
+    return copy.deepcopy(merged)
 
 def save_config(cfg: dict) -> None:
     d = user_config_dir()
     d.mkdir(parents=True, exist_ok=True)
     p = config_path()
     with p.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(cfg, f, sort_keys=False)
+        yaml.dump(cfg, f, Dumper=_Dumper, sort_keys=False)
+    _cfg_cache["key"] = None
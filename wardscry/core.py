@@ -1,24 +1,41 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 import os
+import time
 
 from . import db
 from .templates import template_by_key
 
 def now_iso() -> str:
     # UTC is nice for logs; display layer can localize later.
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+    # Same shape as datetime.isoformat(timespec="seconds"), without building a datetime.
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+
+def _try_create_excl(path: Path, content: bytes) -> Optional[Path]:
+    """
+    Create path and write content, atomically refusing to touch an existing file.
+    Returns None if the name is already taken.
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except FileExistsError:
+        return None
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return path
 
 def safe_plant_file(directory: Path, filename: str, content: bytes) -> Path:
     directory = directory.expanduser().resolve()
     directory.mkdir(parents=True, exist_ok=True)
 
     base = directory / filename
-    if not base.exists():
-        base.write_bytes(content)
+    if _try_create_excl(base, content) is not None:
         return base
 
     # never overwrite: add suffix
@@ -26,8 +43,7 @@ def safe_plant_file(directory: Path, filename: str, content: bytes) -> Path:
     suffix = base.suffix
     for i in range(1, 1000):
         candidate = directory / f"{stem}_{i}{suffix}"
-        if not candidate.exists():
-            candidate.write_bytes(content)
+        if _try_create_excl(candidate, content) is not None:
             return candidate
 
     raise RuntimeError("Could not find a free filename after many attempts.")
@@ -39,34 +55,39 @@ def add_token(
     sensitivity: str,
 ) -> int:
     t = template_by_key(template_key)
-    planted = safe_plant_file(directory, t.default_filename, t.make_bytes())
+    planted = safe_plant_file(directory, t.default_filename(), t.make_bytes())
+    ts = now_iso()
 
-    token_id = db.exec_sql(
-        """
-        INSERT INTO tokens (name, path, token_type, template, sensitivity, status, created_at)
-        VALUES (?, ?, 'file', ?, ?, 'ok', ?)
-        """,
-        (name, str(planted), template_key, sensitivity, now_iso()),
-    )
+    with db.transaction() as con:
+        cur = con.execute(
+            """
+            INSERT INTO tokens (name, path, token_type, template, sensitivity, status, created_at)
+            VALUES (?, ?, 'file', ?, ?, 'ok', ?)
+            """,
+            (name, str(planted), template_key, sensitivity, ts),
+        )
+        token_id = cur.lastrowid
 
-    db.exec_sql(
-        """
-        INSERT INTO events (token_id, ts, event_type, severity, details)
-        VALUES (?, ?, 'created', ?, ?)
-        """,
-        (token_id, now_iso(), "low", f"Planted decoy file at {planted}"),
-    )
+        con.execute(
+            """
+            INSERT INTO events (token_id, ts, event_type, severity, details)
+            VALUES (?, ?, 'created', ?, ?)
+            """,
+            (token_id, ts, "low", f"Planted decoy file at {planted}"),
+        )
     return token_id
 
 def delete_token(token_id: int) -> None:
     # Note: we do NOT delete the file automatically (safer). We can add a checkbox later.
-    db.exec_sql("DELETE FROM events WHERE token_id = ?", (token_id,))
-    db.exec_sql("DELETE FROM tokens WHERE id = ?", (token_id,))
+    with db.transaction() as con:
+        con.execute("DELETE FROM events WHERE token_id = ?", (token_id,))
+        con.execute("DELETE FROM tokens WHERE id = ?", (token_id,))
 
 def reset_token_status(token_id: int) -> None:
     # Don't delete history; just mark token as OK again.
-    db.exec_sql("UPDATE tokens SET status='ok' WHERE id = ?", (token_id,))
-    db.exec_sql(
-        "INSERT INTO events (token_id, ts, event_type, severity, details) VALUES (?, ?, 'note', 'low', ?)",
-        (token_id, now_iso(), "Status reset to ok"),
-    )
+    with db.transaction() as con:
+        con.execute("UPDATE tokens SET status='ok' WHERE id = ?", (token_id,))
+        con.execute(
+            "INSERT INTO events (token_id, ts, event_type, severity, details) VALUES (?, ?, 'note', 'low', ?)",
+            (token_id, now_iso(), "Status reset to ok"),
+        )
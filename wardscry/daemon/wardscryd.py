@@ -1,26 +1,58 @@
 from __future__ import annotations
 
+import itertools
 import json
 import os
+import queue
+import selectors
 import socket
+import struct
+import sys
 import time
 import threading
-import uuid
+from array import array
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Tuple, Set, Optional
 
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
+from wardscry import db
 from wardscry.db import q_all, exec_sql
 
-# --- Optional dependency for read/open detection (Linux) ---
+# --- Read/open detection (Linux inotify, called straight through libc) ---
 try:
-    from inotify_simple import INotify, flags as IFlags
+    import ctypes
+    import ctypes.util
+
+    _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    _libc.inotify_init1.argtypes = [ctypes.c_int]
+    _libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
     HAVE_INOTIFY = True
 except Exception:
     HAVE_INOTIFY = False
 
+# <sys/inotify.h>
+IN_CLOSE_NOWRITE = 0x00000010
+IN_OPEN = 0x00000020
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_INOTIFY_EVENT = struct.Struct("iIII")
+_INOTIFY_READ_SIZE = 64 * 1024
+
+# --- Optional dependency for faster JSONL encoding ---
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> bytes:
+        return orjson.dumps(obj)
+except Exception:
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 
 # Sensitivity -> severity label (simple MVP)
 SEV = {"low": "low", "medium": "medium", "high": "high"}
@@ -31,6 +63,11 @@ SEV_NUM = {"low": 3, "medium": 7, "high": 12}
 # Noise control knobs
 MOD_QUIET_SECONDS = 1.25     # flush a burst if no new mods for this long
 MOD_MAX_WINDOW_SECONDS = 3.0 # cap burst window so it flushes even if constant edits
+FLUSH_RETRY_SECONDS = 2.0    # retry summarized bursts whose DB write failed
+
+# Per-event console lines (opened/modified/deleted/...) are only written when
+# WARDSCRY_DEBUG is set; startup and error messages always print.
+_DEBUG = bool(os.environ.get("WARDSCRY_DEBUG"))
 
 # Hot-reload: how often the daemon re-reads tokens from the DB
 TOKEN_REFRESH_SECONDS = 2.0
@@ -40,11 +77,30 @@ TOKEN_REFRESH_SECONDS = 2.0
 #   export WARDSCRY_SIEM_JSONL=/var/log/wardscry/wardscry.jsonl
 DEFAULT_SIEM_JSONL = "~/.local/share/wardscry/wardscry.jsonl"
 
+_HOST = socket.gethostname()
+
+# Event ids: unique per host + daemon start + sequence number; no RNG needed.
+_EVENT_COUNTER = itertools.count(1)
+_EVENT_PREFIX = f"{_HOST}-{int(time.time())}-"
+
+# Fields identical on every event, pre-encoded once (closing brace stripped);
+# _encode_event() splices the per-event fields in after them.
+_STATIC_PREFIX = _dumps({
+    "observer": {"product": "WardScry", "type": "honeypot"},
+    "host": {"hostname": _HOST},
+})[:-1]
+
 
 def now_iso_utc() -> str:
-    import datetime
-    from datetime import timezone
-    return datetime.datetime.now(timezone.utc).isoformat(timespec="seconds")
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+
+
+def dbg(fmt: str, *args: object) -> None:
+    """
+    Debug line to stderr; formatting is skipped entirely unless WARDSCRY_DEBUG is set.
+    """
+    if _DEBUG:
+        sys.stderr.write((fmt % args if args else fmt) + "\n")
 
 
 def _siem_path() -> Path:
@@ -52,32 +108,150 @@ def _siem_path() -> Path:
     return Path(raw).expanduser()
 
 
+# Group-commit writer: callers enqueue encoded lines; a single thread drains
+# whatever has piled up and appends it with one write on a long-lived handle.
+_siem_q: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+_siem_thread: Optional[threading.Thread] = None
+_siem_start_lock = threading.Lock()
+
+
+def _open_siem_file():
+    path = _siem_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    new_file = not path.exists()
+    fp = open(path, "ab")
+
+    # Try to make it readable for collectors (Wazuh agent often runs as root anyway).
+    if new_file:
+        try:
+            path.chmod(0o644)
+        except Exception:
+            pass
+    return fp
+
+
+def _siem_file_moved(fp) -> bool:
+    """
+    True once the JSONL path no longer names the open file (logrotate, an
+    operator mv/rm), so the writer reopens instead of feeding a dead inode.
+    """
+    try:
+        st = os.stat(_siem_path())
+    except FileNotFoundError:
+        return True
+    open_st = os.fstat(fp.fileno())
+    return (st.st_ino, st.st_dev) != (open_st.st_ino, open_st.st_dev)
+
+
+def _siem_writer() -> None:
+    fp = None
+    stopping = False
+    while not stopping:
+        items = [_siem_q.get()]
+        while True:
+            try:
+                items.append(_siem_q.get_nowait())
+            except queue.Empty:
+                break
+
+        if None in items:
+            stopping = True
+            items = [i for i in items if i is not None]
+        if not items:
+            continue
+
+        try:
+            # One stat per batch, not per event.
+            if fp is not None and _siem_file_moved(fp):
+                fp.close()
+                fp = None
+            if fp is None:
+                fp = _open_siem_file()
+            fp.write(b"".join(items))
+            fp.flush()
+        except Exception as e:
+            print(f"[WardScry] SIEM emit failed: {e}")
+            # Reopen on the next batch rather than retrying a broken handle.
+            if fp is not None:
+                try:
+                    fp.close()
+                except Exception:
+                    pass
+                fp = None
+
+    if fp is not None:
+        fp.close()
+
+
+def _ensure_siem_writer() -> None:
+    global _siem_thread
+    if _siem_thread is not None:
+        return
+    with _siem_start_lock:
+        if _siem_thread is None:
+            t = threading.Thread(target=_siem_writer, name="wardscry-siem", daemon=True)
+            t.start()
+            _siem_thread = t
+
+
+def close_siem() -> None:
+    """
+    Drain pending JSONL events and close the output file.
+    """
+    global _siem_thread
+    with _siem_start_lock:
+        t = _siem_thread
+        _siem_thread = None
+    if t is None:
+        return
+    _siem_q.put(None)
+    t.join(timeout=5.0)
+
+
+def _encode_event(event: dict) -> bytes:
+    """
+    Encode one event as a JSONL line, prefixed with the static observer/host fields.
+    """
+    body = _dumps(event)
+    if body == b"{}":
+        return _STATIC_PREFIX + b"}\n"
+    return _STATIC_PREFIX + b"," + body[1:] + b"\n"
+
+
 def emit_jsonl(event: dict) -> None:
     """
     Append a single-line JSON event for SIEM ingestion.
     - One JSON object per line (JSONL/NDJSON).
+    - Written asynchronously by the SIEM writer thread.
     - Never crashes the daemon if logging fails.
     """
-    try:
-        path = _siem_path()
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        line = json.dumps(event, separators=(",", ":"), ensure_ascii=False)
-        new_file = not path.exists()
+    emit_jsonl_many([event])
 
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
 
-        # Try to make it readable for collectors (Wazuh agent often runs as root anyway).
-        if new_file:
-            try:
-                path.chmod(0o644)
-            except Exception:
-                pass
+def emit_jsonl_many(events: list[dict]) -> None:
+    """
+    Queue several JSONL events; they land in the file with a single write.
+    """
+    if not events:
+        return
+    try:
+        lines = b"".join(_encode_event(event) for event in events)
+        _ensure_siem_writer()
+        _siem_q.put(lines)
     except Exception as e:
         print(f"[WardScry] SIEM emit failed: {e}")
 
 
+@lru_cache(maxsize=8192)
+def _resolve(p: str) -> str:
+    """
+    Memoized expanduser + realpath; event callbacks hit the same few paths
+    over and over, and each resolution costs several lstat() calls.
+    Plain os.path string ops avoid building Path objects on the hot path.
+    """
+    return os.path.realpath(os.path.expanduser(p))
+
+
 def load_tokens() -> Dict[str, Tuple[int, str]]:
     """
     Returns: { resolved_token_path_str: (token_id, sensitivity) }
@@ -85,7 +259,7 @@ def load_tokens() -> Dict[str, Tuple[int, str]]:
     rows = q_all("SELECT id, path, sensitivity FROM tokens")
     out: Dict[str, Tuple[int, str]] = {}
     for r in rows:
-        out[str(Path(r["path"]).expanduser().resolve())] = (int(r["id"]), str(r["sensitivity"]))
+        out[_resolve(r["path"])] = (int(r["id"]), str(r["sensitivity"]))
     return out
 
 
@@ -99,27 +273,90 @@ def write_event(
     sensitivity: Optional[str] = None,
 ) -> None:
     ts = now_iso_utc()
-    exec_sql(
-        "INSERT INTO events (token_id, ts, event_type, severity, details) VALUES (?, ?, ?, ?, ?)",
-        (token_id, ts, event_type, severity, details),
+    with db.transaction() as con:
+        con.execute(db.INSERT_EVENT_SQL, (token_id, ts, event_type, severity, details))
+
+        # Status transitions (defender logic)
+        if event_type == "deleted":
+            con.execute(db.UPDATE_TOKEN_MISSING_SQL, (ts, token_id))
+        elif event_type in ("modified", "renamed", "opened"):
+            con.execute(db.UPDATE_TOKEN_TRIGGERED_SQL, (ts, token_id))
+        else:
+            con.execute(db.UPDATE_TOKEN_TS_SQL, (ts, token_id))
+
+    emit_jsonl(
+        siem_event(
+            ts,
+            token_id,
+            event_type,
+            severity,
+            details,
+            token_path=token_path,
+            sensitivity=sensitivity,
+        )
     )
 
-    # Status transitions (defender logic)
-    if event_type == "deleted":
-        exec_sql("UPDATE tokens SET status='missing', last_event_at=? WHERE id=?", (ts, token_id))
-    elif event_type in ("modified", "renamed", "opened"):
-        exec_sql("UPDATE tokens SET status='triggered', last_event_at=? WHERE id=?", (ts, token_id))
-    else:
-        exec_sql("UPDATE tokens SET last_event_at=? WHERE id=?", (ts, token_id))
 
-    # --- SIEM-friendly JSONL event ---
+def write_modified_events(bursts: list[tuple[int, str, str, str]]) -> None:
+    """
+    Record several "modified" events in one transaction and one JSONL append.
+
+    bursts: [(token_id, sensitivity, resolved_path, details), ...]
+    """
+    if not bursts:
+        return
+
+    ts = now_iso_utc()
+    event_rows = [
+        (token_id, ts, "modified", SEV.get(sens, "low"), details)
+        for token_id, sens, _path, details in bursts
+    ]
+    triggered_ids = sorted({token_id for token_id, _sens, _path, _details in bursts})
+
+    with db.transaction() as con:
+        con.executemany(db.INSERT_EVENT_SQL, event_rows)
+        if len(triggered_ids) == 1:
+            con.execute(db.UPDATE_TOKEN_TRIGGERED_SQL, (ts, triggered_ids[0]))
+        else:
+            con.execute(
+                "UPDATE tokens SET status='triggered', last_event_at=? "
+                f"WHERE id IN ({','.join('?' * len(triggered_ids))})",
+                (ts, *triggered_ids),
+            )
+
+    emit_jsonl_many([
+        siem_event(
+            ts,
+            token_id,
+            "modified",
+            SEV.get(sens, "low"),
+            details,
+            token_path=path,
+            sensitivity=sens,
+        )
+        for token_id, sens, path, details in bursts
+    ])
+
+
+def siem_event(
+    ts: str,
+    token_id: int,
+    event_type: str,
+    severity: str,
+    details: str,
+    *,
+    token_path: Optional[str] = None,
+    sensitivity: Optional[str] = None,
+) -> dict:
+    """
+    Build the SIEM-friendly (ECS-ish) JSONL record for one event.
+    The static "observer"/"host" fields are added at encode time.
+    """
     sev_label = str(severity)
     sev_num = SEV_NUM.get(sev_label, 3)
 
     event = {
         "@timestamp": ts,
-        "observer": {"product": "WardScry", "type": "honeypot"},
-        "host": {"hostname": socket.gethostname()},
         "event": {
             "kind": "alert",
             "action": event_type,
@@ -128,7 +365,7 @@ def write_event(
         "log": {"level": sev_label},
         "file": {"path": token_path} if token_path else {},
         "wardscry": {
-            "event_id": str(uuid.uuid4()),
+            "event_id": _EVENT_PREFIX + format(next(_EVENT_COUNTER), "x"),
             "token_id": token_id,
             "sensitivity": sensitivity,
             "details": details,
@@ -140,7 +377,7 @@ def write_event(
     if not event.get("file"):
         event.pop("file", None)
 
-    emit_jsonl(event)
+    return event
 
 
 class OpenAccessWatcher(threading.Thread):
@@ -156,26 +393,50 @@ class OpenAccessWatcher(threading.Thread):
     def __init__(self, handler: "TokenEventHandler", watched_dirs: Set[str]) -> None:
         super().__init__(daemon=True)
         self.handler = handler
-        self._stop = threading.Event()
+        # Not "_stop": that would shadow threading.Thread._stop and break join().
+        self._stop_event = threading.Event()
         self._lock = threading.Lock()
 
-        self.inotify = INotify()
+        self._fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        # Self-pipe so stop() can wake a select() that otherwise blocks forever.
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._fd, selectors.EVENT_READ)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+
         self.wd_to_dir: Dict[int, str] = {}
         self.dir_to_wd: Dict[str, int] = {}
 
         for d in sorted(watched_dirs):
             self.add_dir(d)
 
+    def _add_watch(self, d: str, mask: int) -> int:
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(d), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            # OSError maps errno to FileNotFoundError/PermissionError/etc.
+            raise OSError(err, os.strerror(err), d)
+        return wd
+
     def add_dir(self, d: str) -> None:
-        d = str(Path(d).expanduser().resolve())
+        d = _resolve(d)
         with self._lock:
-            if d in self.dir_to_wd:
+            # The observer thread can still call in during shutdown; once stop()
+            # ran, the inotify fd is (or is about to be) closed and its number
+            # may already belong to another file.
+            if self._stop_event.is_set() or d in self.dir_to_wd:
                 return
             try:
-                wd = self.inotify.add_watch(
+                wd = self._add_watch(
                     d,
                     # OPEN can be noisy; CLOSE_NOWRITE is the "read attempt" signal.
-                    IFlags.CLOSE_NOWRITE | IFlags.OPEN,
+                    IN_CLOSE_NOWRITE | IN_OPEN,
                 )
             except FileNotFoundError:
                 return
@@ -188,48 +449,81 @@ class OpenAccessWatcher(threading.Thread):
             print(f"[WardScry] OpenWatcher now watching: {d}")
 
     def stop(self) -> None:
-        self._stop.set()
-
-    def run(self) -> None:
-        while not self._stop.is_set():
+        # Under the lock: run() sets the event before closing its fds, so a
+        # set event means the wake pipe may already be closed (and its fd
+        # number reused by the DB or JSONL file) - never write to it then.
+        with self._lock:
+            if self._stop_event.is_set():
+                return
+            self._stop_event.set()
             try:
-                events = self.inotify.read(timeout=1000)  # ms
-            except TypeError:
-                # Older versions may not support timeout; fall back to short sleep loop
-                time.sleep(0.5)
-                continue
-            except Exception:
-                time.sleep(0.5)
-                continue
+                os.write(self._wake_w, b"\0")
+            except OSError:
+                pass
 
-            for ev in events:
-                d = self.wd_to_dir.get(ev.wd)
-                if not d or not ev.name:
+    def run(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                self._selector.select(timeout=None)
+                if self._stop_event.is_set():
+                    break
+                try:
+                    buf = os.read(self._fd, _INOTIFY_READ_SIZE)
+                except BlockingIOError:
+                    continue
+                except Exception:
+                    time.sleep(0.5)
                     continue
+                self._handle_events(buf)
+        finally:
+            # Also reached when run() dies on an error (e.g. a locked DB in
+            # _handle_events): mark the watcher stopped under the lock before
+            # closing anything, so add_dir()/stop() never touch a closed fd.
+            with self._lock:
+                self._stop_event.set()
+                self._selector.close()
+                os.close(self._fd)
+                os.close(self._wake_r)
+                os.close(self._wake_w)
+                self._fd = self._wake_r = self._wake_w = -1
+
+    def _handle_events(self, buf: bytes) -> None:
+        header_size = _INOTIFY_EVENT.size
+        end = len(buf)
+        offset = 0
+        while offset + header_size <= end:
+            wd, mask, _cookie, name_len = _INOTIFY_EVENT.unpack_from(buf, offset)
+            name_start = offset + header_size
+            offset = name_start + name_len
+
+            # "Opened(read)" = close without write
+            if not name_len or not (mask & IN_CLOSE_NOWRITE):
+                continue
 
-                full_path = str(Path(d) / ev.name)
+            d = self.wd_to_dir.get(wd)
+            if not d:
+                continue
 
-                hit = self.handler._lookup_token(full_path)
-                if not hit:
-                    continue
+            name = os.fsdecode(buf[name_start:offset].rstrip(b"\0"))
+            full_path = os.path.join(d, name)
 
-                token_id, sens, resolved = hit
+            hit = self.handler._lookup_token(full_path)
+            if not hit:
+                continue
 
-                ev_flags = IFlags.from_mask(ev.mask)
+            token_id, sens, resolved = hit
 
-                # "Opened(read)" = close without write
-                if IFlags.CLOSE_NOWRITE in ev_flags:
-                    # Debounce to avoid spam if apps open repeatedly
-                    if self.handler._debounced(token_id, "opened", window=1.0):
-                        continue
-                    self.handler._log_immediate(
-                        token_id,
-                        sens,
-                        "opened",
-                        f"opened(read) -> {resolved}",
-                        resolved_path=resolved,
-                    )
-                    print(f"[WardScry] opened(read): {resolved}")
+            # Debounce to avoid spam if apps open repeatedly
+            if self.handler._debounced(token_id, "opened", window=1.0):
+                continue
+            self.handler._log_immediate(
+                token_id,
+                sens,
+                "opened",
+                f"opened(read) -> {resolved}",
+                resolved_path=resolved,
+            )
+            dbg("[WardScry] opened(read): %s", resolved)
 
 
 class TokenEventHandler(FileSystemEventHandler):
@@ -246,8 +540,11 @@ class TokenEventHandler(FileSystemEventHandler):
         self.watched_dirs = watched_dirs
         self.open_watcher = open_watcher
 
-        # Lock for modified-burst buffering
+        # Lock for modified-burst buffering; the condition wakes the flusher
+        # thread when a new burst starts or the daemon is stopping.
         self._lock = threading.Lock()
+        self._flush_cv = threading.Condition(self._lock)
+        self._flush_stop = False
 
         # Lock for token_map reads/writes
         self._map_lock = threading.Lock()
@@ -255,12 +552,25 @@ class TokenEventHandler(FileSystemEventHandler):
         # Lock for watched_dirs (schedule changes can happen from observer thread + main thread)
         self._watch_lock = threading.Lock()
 
+        # PRAGMA data_version seen at the last token reload (0 = never loaded)
+        self._last_data_version = 0
+
         # Debounce for non-burst events (rename/delete/open)
         self._last_seen: Dict[Tuple[int, str], float] = {}  # (token_id, event_type) -> time
 
-        # Burst buffer for modified events:
-        # token_id -> dict with keys: path, sens, first, last, count
-        self._mod_bursts: Dict[int, Dict[str, object]] = {}
+        # Burst buffer for modified events, stored column-wise: one slot per
+        # token with an open burst, token_id -> slot via _burst_idx.
+        self._burst_idx: Dict[int, int] = {}
+        self._burst_ids: list[int] = []
+        self._burst_path: list[str] = []
+        self._burst_sens: list[str] = []
+        self._burst_first = array("d")
+        self._burst_last = array("d")
+        self._burst_count = array("q")
+
+        # Summarized bursts whose write failed, retried at _retry_at.
+        self._failed_bursts: list[tuple[int, str, str, str]] = []
+        self._retry_at = 0.0
 
     def _debounced(self, token_id: int, event_type: str, window: float = 0.75) -> bool:
         now = time.time()
@@ -272,7 +582,7 @@ class TokenEventHandler(FileSystemEventHandler):
         return False
 
     def _ensure_watch_dir_for(self, path: str) -> None:
-        d = str(Path(path).expanduser().resolve().parent)
+        d = os.path.dirname(_resolve(path))
         with self._watch_lock:
             if d in self.watched_dirs:
                 return
@@ -283,7 +593,7 @@ class TokenEventHandler(FileSystemEventHandler):
         if self.open_watcher is not None:
             self.open_watcher.add_dir(d)
 
-        print(f"[WardScry] Now watching: {d}")
+        dbg("[WardScry] Now watching: %s", d)
 
     def refresh_tokens_from_db(self) -> None:
         """
@@ -292,7 +602,13 @@ class TokenEventHandler(FileSystemEventHandler):
         - Updates self.token_map atomically
         - Adds new directory watches for any newly-added token paths
         - Does NOT unschedule watches (fine for MVP)
+        - Skips the reload entirely if nothing was committed since last time
         """
+        version = db.data_version()
+        if version == self._last_data_version:
+            return
+        self._last_data_version = version
+
         new_map = load_tokens()
 
         with self._map_lock:
@@ -315,8 +631,20 @@ class TokenEventHandler(FileSystemEventHandler):
     def _lookup_token(self, path: str) -> Optional[Tuple[int, str, str]]:
         """
         Returns (token_id, sens, resolved_path) if path is a tracked token.
+
+        Watches are scheduled on resolved directories, so the paths watchdog
+        and inotify hand us normally match token_map keys as-is; only fall
+        back to resolving on a miss (e.g. a token that is itself a symlink).
         """
-        p = str(Path(path).expanduser().resolve())
+        with self._map_lock:
+            hit = self.token_map.get(path)
+        if hit:
+            token_id, sens = hit
+            return token_id, sens, path
+
+        p = _resolve(path)
+        if p == path:
+            return None
         with self._map_lock:
             hit = self.token_map.get(p)
         if not hit:
@@ -346,55 +674,132 @@ class TokenEventHandler(FileSystemEventHandler):
     def _buffer_modified(self, token_id: int, sens: str, resolved_path: str) -> None:
         now = time.time()
         with self._lock:
-            b = self._mod_bursts.get(token_id)
-            if b is None:
-                self._mod_bursts[token_id] = {
-                    "path": resolved_path,
-                    "sens": sens,
-                    "first": now,
-                    "last": now,
-                    "count": 1,
-                }
+            i = self._burst_idx.get(token_id)
+            if i is None:
+                self._burst_idx[token_id] = len(self._burst_ids)
+                self._burst_ids.append(token_id)
+                self._burst_path.append(resolved_path)
+                self._burst_sens.append(sens)
+                self._burst_first.append(now)
+                self._burst_last.append(now)
+                self._burst_count.append(1)
+                self._flush_cv.notify()
             else:
-                b["path"] = resolved_path
-                b["sens"] = sens
-                b["last"] = now
-                b["count"] = int(b["count"]) + 1
+                self._burst_path[i] = resolved_path
+                self._burst_sens[i] = sens
+                self._burst_last[i] = now
+                self._burst_count[i] += 1
+
+    def _next_flush_deadline(self) -> Optional[float]:
+        # Caller holds self._lock.
+        first = self._burst_first
+        last = self._burst_last
+        deadline: Optional[float] = self._retry_at if self._failed_bursts else None
+        for i in range(len(first)):
+            due = min(first[i] + MOD_MAX_WINDOW_SECONDS, last[i] + MOD_QUIET_SECONDS)
+            if deadline is None or due < deadline:
+                deadline = due
+        return deadline
+
+    def _compact_bursts(self, keep: list[int]) -> None:
+        # Caller holds self._lock. Keep only the given slots, in order.
+        self._burst_ids = [self._burst_ids[i] for i in keep]
+        self._burst_path = [self._burst_path[i] for i in keep]
+        self._burst_sens = [self._burst_sens[i] for i in keep]
+        self._burst_first = array("d", [self._burst_first[i] for i in keep])
+        self._burst_last = array("d", [self._burst_last[i] for i in keep])
+        self._burst_count = array("q", [self._burst_count[i] for i in keep])
+        self._burst_idx = {token_id: i for i, token_id in enumerate(self._burst_ids)}
+
+    def run_flusher(self) -> None:
+        """
+        Flusher thread body: sleep until the earliest burst is due (or
+        indefinitely while nothing is buffered), then flush.
+        """
+        while True:
+            with self._flush_cv:
+                if self._flush_stop:
+                    return
+                deadline = self._next_flush_deadline()
+                timeout = None if deadline is None else max(0.0, deadline - time.time())
+                self._flush_cv.wait(timeout)
+                if self._flush_stop:
+                    return
+            try:
+                self.flush_modified_bursts()
+            except Exception as e:
+                # Never let one bad pass end the thread: modifications would
+                # silently stop being reported while the daemon keeps running.
+                print(f"[WardScry] Modified-event flush failed: {e}")
 
-    def flush_modified_bursts(self) -> None:
+    def stop_flusher(self) -> None:
+        """
+        Stop the flusher thread and write out every burst still buffered.
+        """
+        with self._flush_cv:
+            self._flush_stop = True
+            self._flush_cv.notify_all()
+        self.flush_modified_bursts(force=True)
+
+    def flush_modified_bursts(self, force: bool = False) -> None:
         """
         Flush buffered modified events into a single summarized DB event.
-        Called from the main loop periodically.
+        Called from the flusher thread when a burst goes quiet or hits the max window
+        (force=True flushes every burst, for shutdown). Bursts whose write fails
+        are kept and retried on a later pass.
         """
         now = time.time()
-        to_flush: list[tuple[int, Dict[str, object]]] = []
+        to_flush: list[tuple[int, str, str, int, float]] = []
 
         with self._lock:
-            for token_id, b in list(self._mod_bursts.items()):
-                first = float(b["first"])
-                last = float(b["last"])
-                count = int(b["count"])
-
-                quiet = (now - last) >= MOD_QUIET_SECONDS
-                too_long = (now - first) >= MOD_MAX_WINDOW_SECONDS
-
-                if quiet or too_long:
-                    to_flush.append((token_id, b))
-                    del self._mod_bursts[token_id]
-
-        for token_id, b in to_flush:
-            path = str(b["path"])
-            sens = str(b["sens"])
-            count = int(b["count"])
-            dur = max(0.0, float(b["last"]) - float(b["first"]))
+            first = self._burst_first
+            last = self._burst_last
+            keep: list[int] = []
+            for i in range(len(first)):
+                quiet = (now - last[i]) >= MOD_QUIET_SECONDS
+                too_long = (now - first[i]) >= MOD_MAX_WINDOW_SECONDS
+
+                if force or quiet or too_long:
+                    to_flush.append((
+                        self._burst_ids[i],
+                        self._burst_path[i],
+                        self._burst_sens[i],
+                        self._burst_count[i],
+                        max(0.0, last[i] - first[i]),
+                    ))
+                else:
+                    keep.append(i)
+
+            if to_flush:
+                self._compact_bursts(keep)
+
+            if self._failed_bursts and (force or now >= self._retry_at):
+                bursts, self._failed_bursts = self._failed_bursts, []
+            else:
+                bursts = []
 
+        for token_id, path, sens, count, dur in to_flush:
             if count <= 1:
                 details = f"modified -> {path}"
             else:
                 details = f"modified -> {path} (burst x{count} over {dur:.3f}s)"
 
-            self._log_immediate(token_id, sens, "modified", details, resolved_path=path)
-            print(f"[WardScry] modified: {path}" + (f" (burst x{count})" if count > 1 else ""))
+            bursts.append((token_id, sens, path, details))
+            if count > 1:
+                dbg("[WardScry] modified: %s (burst x%d)", path, count)
+            else:
+                dbg("[WardScry] modified: %s", path)
+
+        if not bursts:
+            return
+        try:
+            write_modified_events(bursts)
+        except Exception as e:
+            print(f"[WardScry] Writing modified events failed (will retry): {e}")
+            with self._flush_cv:
+                self._failed_bursts = bursts + self._failed_bursts
+                self._retry_at = time.time() + FLUSH_RETRY_SECONDS
+                self._flush_cv.notify_all()
 
     # ---- Watchdog callbacks ----
 
@@ -427,14 +832,14 @@ class TokenEventHandler(FileSystemEventHandler):
         if self._debounced(token_id, "deleted"):
             return
         self._log_immediate(token_id, sens, "deleted", f"deleted -> {resolved}", resolved_path=resolved)
-        print(f"[WardScry] deleted: {resolved}")
+        dbg("[WardScry] deleted: %s", resolved)
 
     def on_moved(self, event) -> None:
         if event.is_directory:
             return
 
-        src = str(Path(event.src_path).expanduser().resolve())
-        dest = str(Path(event.dest_path).expanduser().resolve())
+        src = _resolve(event.src_path)
+        dest = _resolve(event.dest_path)
 
         # Token itself renamed/moved
         with self._map_lock:
@@ -464,7 +869,7 @@ class TokenEventHandler(FileSystemEventHandler):
 
             self._ensure_watch_dir_for(dest)
 
-            print(f"[WardScry] renamed: {src} -> {dest}")
+            dbg("[WardScry] renamed: %s -> %s", src, dest)
             return
 
         # Atomic-save style replace: dest becomes the token path
@@ -479,7 +884,7 @@ class TokenEventHandler(FileSystemEventHandler):
 
 def main() -> None:
     token_map = load_tokens()
-    watched_dirs: Set[str] = {str(Path(p).parent) for p in token_map.keys()}
+    watched_dirs: Set[str] = {os.path.dirname(p) for p in token_map.keys()}
 
     if watched_dirs:
         print("[WardScry] Watching directories:")
@@ -502,32 +907,33 @@ def main() -> None:
         print("[WardScry] Open/read detection enabled (inotify).")
     else:
         handler = TokenEventHandler(token_map, observer, watched_dirs, open_watcher=None)
-        print("[WardScry] Open/read detection NOT enabled (missing inotify-simple).")
+        print("[WardScry] Open/read detection NOT enabled (inotify unavailable).")
 
     for d in sorted(watched_dirs):
         observer.schedule(handler, d, recursive=False)
 
     observer.start()
+
+    flusher = threading.Thread(target=handler.run_flusher, name="wardscry-flush", daemon=True)
+    flusher.start()
     print("[WardScry] Daemon running. Ctrl+C to stop.")
 
-    last_refresh = 0.0
     try:
         while True:
-            time.sleep(1.0)
-            handler.flush_modified_bursts()
-
-            now = time.time()
-            if (now - last_refresh) >= TOKEN_REFRESH_SECONDS:
-                handler.refresh_tokens_from_db()
-                last_refresh = now
+            time.sleep(TOKEN_REFRESH_SECONDS)
+            handler.refresh_tokens_from_db()
 
     except KeyboardInterrupt:
         print("\n[WardScry] Stopping…")
     finally:
+        handler.stop_flusher()
+        flusher.join(timeout=5.0)
         if open_watcher is not None:
             open_watcher.stop()
+            open_watcher.join(timeout=5.0)
         observer.stop()
         observer.join()
+        close_siem()
 
 
 if __name__ == "__main__":
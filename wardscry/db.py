@@ -1,7 +1,10 @@
 from __future__ import annotations
+import atexit
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Iterator, Optional
 from .paths import db_path, user_data_dir
 
 SCHEMA = '''
@@ -32,45 +35,108 @@ CREATE TABLE IF NOT EXISTS events (
 
 CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts DESC);
 CREATE INDEX IF NOT EXISTS idx_events_token ON events(token_id, ts DESC);
+-- Alert counts only ever look at high/medium rows; keep that index small.
+CREATE INDEX IF NOT EXISTS idx_events_alerts_ts ON events(ts, severity) WHERE severity IN ('high','medium');
 '''
 
+# Hot-path statements shared by the daemon. Keeping the text identical lets
+# sqlite3's per-connection statement cache reuse the compiled plans.
+INSERT_EVENT_SQL = "INSERT INTO events (token_id, ts, event_type, severity, details) VALUES (?, ?, ?, ?, ?)"
+UPDATE_TOKEN_TRIGGERED_SQL = "UPDATE tokens SET status='triggered', last_event_at=? WHERE id=?"
+UPDATE_TOKEN_MISSING_SQL = "UPDATE tokens SET status='missing', last_event_at=? WHERE id=?"
+UPDATE_TOKEN_TS_SQL = "UPDATE tokens SET last_event_at=? WHERE id=?"
+
+# Applied once per connection. WAL lets the GUI read while the daemon writes;
+# synchronous=NORMAL is safe under WAL and skips the per-commit fsync of FULL.
+# mmap_size lets the GUI's polling reads come straight from mapped pages.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=67108864",
+)
+
+# One long-lived connection per thread (daemon threads, GUI thread).
+_tls = threading.local()
+
+# Bumped on every write made through this module (see get_db_version()).
+_db_version = 0
+
 def connect() -> sqlite3.Connection:
+    """
+    This thread's connection, opened (and PRAGMA-configured) on first use.
+    q_all/q_one/exec_sql all go through here, so pages polling every few
+    seconds reuse one warm connection and its page/statement caches.
+    """
+    con = getattr(_tls, "con", None)
+    if con is not None:
+        return con
     user_data_dir().mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(db_path())
+    # isolation_level=None: autocommit; each statement outside an explicit
+    # transaction commits on its own.
+    con = sqlite3.connect(db_path(), isolation_level=None, check_same_thread=False)
     con.row_factory = sqlite3.Row
+    for pragma in PRAGMAS:
+        con.execute(pragma)
+    _tls.con = con
     return con
 
-def init_db() -> None:
-    con = connect()
-    try:
-        con.executescript(SCHEMA)
-        con.commit()
-    finally:
+def close() -> None:
+    con = getattr(_tls, "con", None)
+    if con is not None:
+        _tls.con = None
         con.close()
 
+atexit.register(close)
+
+def init_db() -> None:
+    connect().executescript(SCHEMA)
+
 def q_all(sql: str, params: tuple = ()) -> list[sqlite3.Row]:
-    con = connect()
-    try:
-        cur = con.execute(sql, params)
-        rows = cur.fetchall()
-        return rows
-    finally:
-        con.close()
+    return connect().execute(sql, params).fetchall()
 
 def q_one(sql: str, params: tuple = ()) -> Optional[sqlite3.Row]:
-    con = connect()
-    try:
-        cur = con.execute(sql, params)
-        row = cur.fetchone()
-        return row
-    finally:
-        con.close()
+    return connect().execute(sql, params).fetchone()
 
 def exec_sql(sql: str, params: tuple = ()) -> int:
+    cur = connect().execute(sql, params)
+    bump_db_version()
+    return cur.lastrowid
+
+def data_version() -> int:
+    """
+    SQLite's data_version for this thread's connection: changes whenever
+    another connection commits to the database.
+    """
+    return int(connect().execute("PRAGMA data_version").fetchone()[0])
+
+def bump_db_version() -> None:
+    global _db_version
+    _db_version += 1
+
+def get_db_version() -> tuple[int, int]:
+    """
+    Cheap "has anything changed?" token for caching query results.
+    Combines this process's write counter with data_version, which only
+    reflects commits from *other* connections (e.g. the daemon).
+    """
+    return _db_version, data_version()
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """
+    Run several statements as one write transaction (one commit).
+    Rolls back if the block raises.
+    """
     con = connect()
+    con.execute("BEGIN IMMEDIATE")
     try:
-        cur = con.execute(sql, params)
+        yield con
+    except BaseException:
+        con.rollback()
+        raise
+    else:
         con.commit()
-        return cur.lastrowid
-    finally:
-        con.close()
+        bump_db_version()
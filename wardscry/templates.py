@@ -11,7 +11,7 @@ import secrets
 class TokenTemplate:
     key: str
     display: str
-    default_filename: str
+    default_filename: Callable[[], str]
     make_bytes: Callable[[], bytes]
 
 
@@ -23,29 +23,44 @@ def _rand(n: int) -> bytes:
     return os.urandom(n)
 
 
-def _sprinkle(blob: bytes, markers: list[bytes]) -> bytes:
+def _sprinkle(buf: bytearray, start: int, end: int, markers: list[bytes]) -> None:
     """
-    Inject a few ASCII-ish markers into random spots so `strings` output
-    looks plausibly relevant, while the file remains effectively unreadable/corrupt.
+    Inject a few ASCII-ish markers into random spots of buf[start:end] (in place)
+    so `strings` output looks plausibly relevant, while the file remains
+    effectively unreadable/corrupt.
     """
-    b = bytearray(blob)
-    if len(b) < 64:
-        return bytes(b)
+    n = end - start
+    if n < 64:
+        return
 
-    for m in markers:
-        if len(m) >= len(b) - 1:
-            continue
-        off = secrets.randbelow(len(b) - len(m) - 1)
-        b[off : off + len(m)] = m
-    return bytes(b)
+    with memoryview(buf) as mv:
+        for m in markers:
+            if len(m) >= n - 1:
+                continue
+            off = start + secrets.randbelow(n - len(m) - 1)
+            mv[off : off + len(m)] = m
+
+
+def _build(head: bytes, body_len: int, markers: list[bytes], tail: bytes = b"") -> bytes:
+    """
+    head + random body (with sprinkled markers) + tail, assembled in a single
+    preallocated buffer.
+    """
+    body_start = len(head)
+    body_end = body_start + body_len
+    buf = bytearray(body_end + len(tail))
+    buf[:body_start] = head
+    buf[body_start:body_end] = _rand(body_len)
+    _sprinkle(buf, body_start, body_end, markers)
+    buf[body_end:] = tail
+    return bytes(buf)
 
 
 def _make_corrupt_pdf_invoice() -> bytes:
     # PDF signature + garbage + EOF marker (intentionally missing valid xref structure)
-    head = b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n"
-    body = _rand(4096)
-    body = _sprinkle(
-        body,
+    return _build(
+        b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n",
+        4096,
         [
             b"/Producer (Acme Scan Service)\n",
             b"/Title (AP Invoices Q4)\n",
@@ -54,9 +69,8 @@ def _make_corrupt_pdf_invoice() -> bytes:
             b"stream\n",
             b"endstream\n",
         ],
+        tail=b"\n%%EOF\n",
     )
-    tail = b"\n%%EOF\n"
-    return head + body + tail
 
 
 def _make_corrupt_xlsx_payroll() -> bytes:
@@ -64,11 +78,10 @@ def _make_corrupt_xlsx_payroll() -> bytes:
     XLSX files are ZIP containers. We include the ZIP local-file signature (PK..)
     so it looks right, but keep it invalid so unzip/Office recovery fails.
     """
-    # ZIP local file header signature
-    head = b"PK\x03\x04" + _rand(26)  # bogus header fields
-    body = _rand(8192)
-    body = _sprinkle(
-        body,
+    # ZIP local file header signature + bogus header fields
+    return _build(
+        b"PK\x03\x04" + _rand(26),
+        8192,
         [
             b"[Content_Types].xml",
             b"xl/workbook.xml",
@@ -79,7 +92,6 @@ def _make_corrupt_xlsx_payroll() -> bytes:
             b"Finance",
         ],
     )
-    return head + body
 
 
 def _make_corrupt_sqlite_cache() -> bytes:
@@ -87,10 +99,9 @@ def _make_corrupt_sqlite_cache() -> bytes:
     SQLite magic header then junk pages.
     Many tools will still identify it as SQLite, but sqlite3 will refuse to open it.
     """
-    head = b"SQLite format 3\x00"
-    body = _rand(4096 * 2)
-    body = _sprinkle(
-        body,
+    return _build(
+        b"SQLite format 3\x00",
+        4096 * 2,
         [
             b"token_cache",
             b"api_clients",
@@ -99,34 +110,33 @@ def _make_corrupt_sqlite_cache() -> bytes:
             b"redacted",
         ],
     )
-    return head + body
 
 
 TEMPLATES: list[TokenTemplate] = [
     TokenTemplate(
         key="corrupt_pdf_invoice",
         display="Invoice scans (PDF, corrupted)",
-        default_filename=f"AP_Invoices_Q4_{_today()}.pdf",
+        default_filename=lambda: f"AP_Invoices_Q4_{_today()}.pdf",
         make_bytes=_make_corrupt_pdf_invoice,
     ),
     TokenTemplate(
         key="corrupt_xlsx_payroll",
         display="Payroll export (XLSX, corrupted)",
-        default_filename=f"Payroll_Export_{_today()}.xlsx",
+        default_filename=lambda: f"Payroll_Export_{_today()}.xlsx",
         make_bytes=_make_corrupt_xlsx_payroll,
     ),
     TokenTemplate(
         key="corrupt_sqlite_cache",
         display="Auth cache (SQLite, corrupted)",
-        default_filename=f"auth_cache_{_today()}.sqlite",
+        default_filename=lambda: f"auth_cache_{_today()}.sqlite",
         make_bytes=_make_corrupt_sqlite_cache,
     ),
 ]
 
 
+TEMPLATES_BY_KEY: dict[str, TokenTemplate] = {t.key: t for t in TEMPLATES}
+
+
 def template_by_key(key: str) -> TokenTemplate:
-    for t in TEMPLATES:
-        if t.key == key:
-            return t
-    raise KeyError(key)
+    return TEMPLATES_BY_KEY[key]
 
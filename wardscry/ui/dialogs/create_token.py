@@ -5,10 +5,27 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QLineEdit, QComboBox,
     QPushButton, QHBoxLayout, QFileDialog, QMessageBox
 )
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 
 from ...templates import TEMPLATES
 from ...core import add_token
 
+# Built on first dialog open (needs a running QApplication), then shared by
+# every CreateTokenDialog so template items aren't rebuilt per open.
+_TEMPLATE_MODEL: QStandardItemModel | None = None
+
+def _template_model() -> QStandardItemModel:
+    global _TEMPLATE_MODEL
+    if _TEMPLATE_MODEL is None:
+        model = QStandardItemModel()
+        for t in TEMPLATES:
+            item = QStandardItem(t.display)
+            item.setData(t.key, Qt.UserRole)
+            model.appendRow(item)
+        _TEMPLATE_MODEL = model
+    return _TEMPLATE_MODEL
+
 class CreateTokenDialog(QDialog):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
@@ -22,8 +39,9 @@ class CreateTokenDialog(QDialog):
         self.ed_name.setPlaceholderText("e.g., Finance Firewall Backup")
 
         self.cmb_template = QComboBox()
-        for t in TEMPLATES:
-            self.cmb_template.addItem(t.display, t.key)
+        self.cmb_template.blockSignals(True)
+        self.cmb_template.setModel(_template_model())
+        self.cmb_template.blockSignals(False)
 
         self.cmb_sens = QComboBox()
         self.cmb_sens.addItems(["low", "medium", "high"])
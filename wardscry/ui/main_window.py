@@ -2,15 +2,20 @@ from __future__ import annotations
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
-    QListWidget, QListWidgetItem, QStackedWidget, QLabel
+    QListWidget, QListWidgetItem, QStackedWidget, QLabel, QAbstractButton
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QEvent
 
+from ..db import get_db_version
 from .pages.dashboard import DashboardPage
 from .pages.tokens import TokensPage
 from .pages.alerts import AlertsPage
 from .pages.settings import SettingsPage
 
+# Auto-refresh cadence: start fast, double while the DB stays unchanged, cap.
+REFRESH_INTERVAL_MS = 2000
+MAX_REFRESH_INTERVAL_MS = 30000
+
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
@@ -34,30 +39,77 @@ class MainWindow(QMainWindow):
             item.setTextAlignment(Qt.AlignVCenter | Qt.AlignLeft)
             self.nav.addItem(item)
 
-        # Pages
+        # Pages: only the Dashboard is built up front; the rest start as empty
+        # placeholders and are constructed the first time they are selected.
         self.stack = QStackedWidget()
-        self.pages = {
-            0: DashboardPage(),
-            1: TokensPage(),
-            2: AlertsPage(),
-            3: SettingsPage(),
+        self._page_factories = {
+            0: DashboardPage,
+            1: TokensPage,
+            2: AlertsPage,
+            3: SettingsPage,
         }
+        self.pages = {0: DashboardPage()}
         for i in range(4):
-            self.stack.addWidget(self.pages[i])
+            self.stack.addWidget(self.pages.get(i) or QWidget())
 
         outer.addWidget(self.nav)
         outer.addWidget(self.stack, 1)
 
-        self.nav.currentRowChanged.connect(self.stack.setCurrentIndex)
-        self.nav.setCurrentRow(0)
-
         # Light auto-refresh so GUI updates if a daemon starts writing events later.
+        # One timer for all pages; its interval backs off while nothing changes,
+        # and it only runs while the current page wants polling (see show_page).
+        self._last_db_version = None
+        self._idle_count = 0
         self.refresh_timer = QTimer(self)
-        self.refresh_timer.setInterval(2000)
+        self.refresh_timer.setInterval(REFRESH_INTERVAL_MS)
         self.refresh_timer.timeout.connect(self.refresh_visible_page)
-        self.refresh_timer.start()
+
+        self.nav.currentRowChanged.connect(self.show_page)
+        self.nav.currentRowChanged.connect(self.reset_refresh_backoff)
+        self._watch_activity(self.pages[0])
+        self.nav.setCurrentRow(0)
+
+    def show_page(self, idx: int) -> None:
+        if idx not in self.pages:
+            placeholder = self.stack.widget(idx)
+            page = self._page_factories[idx]()
+            self.pages[idx] = page
+            self._watch_activity(page)
+            self.stack.insertWidget(idx, page)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+        self.stack.setCurrentIndex(idx)
+        # Only pages showing daemon-written data keep the timer running.
+        if getattr(self.pages[idx], "wants_polling", True):
+            if not self.refresh_timer.isActive():
+                self.refresh_timer.start()
+        else:
+            self.refresh_timer.stop()
+
+    def _watch_activity(self, page: QWidget) -> None:
+        # "User is here" signals that snap the cadence back to fast: button
+        # clicks and table scrolling (nav changes are wired in __init__).
+        for btn in page.findChildren(QAbstractButton):
+            btn.clicked.connect(self.reset_refresh_backoff)
+        table = getattr(page, "table", None)
+        if table is not None:
+            table.verticalScrollBar().valueChanged.connect(self.reset_refresh_backoff)
+
+    def reset_refresh_backoff(self) -> None:
+        self._idle_count = 0
+        if self.refresh_timer.interval() != REFRESH_INTERVAL_MS:
+            self.refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        # Catch up straight away when the window comes back on screen / into focus.
+        if event.type() in (QEvent.ActivationChange, QEvent.WindowStateChange):
+            self.refresh_visible_page()
 
     def refresh_visible_page(self) -> None:
+        # Nothing on screen (or user is elsewhere): skip the DB work entirely.
+        if self.isMinimized() or not self.isVisible() or not self.isActiveWindow():
+            return
         w = self.stack.currentWidget()
         if hasattr(w, "refresh"):
             try:
@@ -65,3 +117,18 @@ class MainWindow(QMainWindow):
             except Exception:
                 # Keep GUI resilient even if DB/config has oddities.
                 pass
+        self._update_refresh_backoff()
+
+    def _update_refresh_backoff(self) -> None:
+        try:
+            version = get_db_version()
+        except Exception:
+            return
+        if version == self._last_db_version:
+            self._idle_count = min(self._idle_count + 1, 8)
+        else:
+            self._last_db_version = version
+            self._idle_count = 0
+        interval = min(MAX_REFRESH_INTERVAL_MS, REFRESH_INTERVAL_MS * 2 ** self._idle_count)
+        if self.refresh_timer.interval() != interval:
+            self.refresh_timer.setInterval(interval)
@@ -1,12 +1,15 @@
 from __future__ import annotations
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView, QAbstractItemView
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QAbstractItemView
+from PySide6.QtCore import Qt, QTimer
 
-from ...db import q_all
-from ..widgets import section_title, hint
-from .events_model import EventsModel
+from ..widgets import section_title, hint, HeaderSizedTableView, REFRESH_DEBOUNCE_MS
+from .events_model import EventsModel, query_events
+from .background import BackgroundQuery
 
 class AlertsPage(QWidget):
+    # Live feed of daemon events.
+    wants_polling = True
+
     def __init__(self) -> None:
         super().__init__()
         lay = QVBoxLayout(self)
@@ -22,7 +25,7 @@ class AlertsPage(QWidget):
         btn_row.addWidget(self.btn_refresh)
         lay.addLayout(btn_row)
 
-        self.table = QTableView()
+        self.table = HeaderSizedTableView()
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setSortingEnabled(True)
@@ -31,18 +34,40 @@ class AlertsPage(QWidget):
 
         self.model = EventsModel([])
         self.table.setModel(self.model)
+        # Header-based widths, computed once; refreshes never re-measure.
+        self.table.resizeColumnsToContents()
         self.table.sortByColumn(0, Qt.DescendingOrder)
 
+        self._refresh_pending = QTimer(self)
+        self._refresh_pending.setSingleShot(True)
+        self._refresh_pending.setInterval(REFRESH_DEBOUNCE_MS)
+        self._refresh_pending.timeout.connect(self._do_refresh)
+        # SQLite runs on the DB worker thread; rows come back via a queued signal.
+        self._query = BackgroundQuery(self, self._on_rows)
+
         self.btn_refresh.clicked.connect(self.refresh)
 
-        self.refresh()
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._do_refresh()
 
     def refresh(self) -> None:
-        rows = q_all("""
-            SELECT e.ts, t.name AS token, e.event_type, e.severity, e.details
-            FROM events e
-            JOIN tokens t ON t.id = e.token_id
-            ORDER BY e.ts DESC
-            LIMIT 500
-        """)
-        self.model.set_rows(rows)
+        # Debounced: a burst of calls becomes one query.
+        self._refresh_pending.start()
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending.stop()
+        # Never hit the DB while another page is on screen.
+        if not self.isVisible():
+            return
+        # Only the loaded window is re-queried; scrolling pulls older pages.
+        limit = self.model.reload_limit()
+        self._query.submit(lambda: (query_events(limit), limit))
+
+    def _on_rows(self, result) -> None:
+        rows, limit = result
+        if limit < self.model.reload_limit():
+            # fetchMore grew the window while this ran; re-query the larger one.
+            self.refresh()
+            return
+        self.model.apply_reload(rows, limit)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+# One long-lived worker: queries run one at a time, off the GUI thread, and
+# the thread never expires, so its thread-local DB connection is reused
+# rather than reopened (and leaked) every time the pool idles out.
+_POOL: QThreadPool | None = None
+
+def _pool() -> QThreadPool:
+    global _POOL
+    if _POOL is None:
+        _POOL = QThreadPool()
+        _POOL.setMaxThreadCount(1)
+        _POOL.setExpiryTimeout(-1)
+    return _POOL
+
+class _QuerySignals(QObject):
+    done = Signal(object)
+    failed = Signal(str)
+
+class QueryRunnable(QRunnable):
+    def __init__(self, signals: _QuerySignals, fn: Callable[..., Any], *args: Any) -> None:
+        super().__init__()
+        self._signals = signals
+        self._fn = fn
+        self._args = args
+
+    def run(self) -> None:
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            self._signals.failed.emit(str(e))
+            return
+        self._signals.done.emit(result)
+
+class BackgroundQuery(QObject):
+    """
+    Runs one query function at a time on the DB worker thread and hands the
+    result to `on_done` back on the GUI thread (queued signal).
+    A submit() while a query is in flight is coalesced: the latest request
+    runs once the current one finishes, so results are never stale.
+    """
+    def __init__(self, parent: QObject, on_done: Callable[[Any], None]) -> None:
+        super().__init__(parent)
+        self._signals = _QuerySignals(self)
+        self._signals.done.connect(self._on_done)
+        self._signals.failed.connect(self._on_failed)
+        self._on_done_cb = on_done
+        self._inflight = False
+        self._queued: tuple | None = None
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        if self._inflight:
+            self._queued = (fn, *args)
+            return
+        self._inflight = True
+        _pool().start(QueryRunnable(self._signals, fn, *args))
+
+    def _on_done(self, result: Any) -> None:
+        try:
+            self._on_done_cb(result)
+        finally:
+            self._finish()
+
+    def _on_failed(self, _msg: str) -> None:
+        # Keep GUI resilient even if DB/config has oddities; next refresh retries.
+        self._finish()
+
+    def _finish(self) -> None:
+        self._inflight = False
+        if self._queued is not None:
+            queued, self._queued = self._queued, None
+            self.submit(*queued)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame
 from PySide6.QtCore import Qt
+import time
 
-from ...db import q_one
+from ...db import q_one, get_db_version
 from ..widgets import section_title, hint
 
 class StatCard(QFrame):
@@ -21,18 +22,39 @@ class StatCard(QFrame):
         f.setPointSize(f.pointSize() + 10)
         f.setBold(True)
         v.setFont(f)
+        self._value_label = v
 
         lay.addWidget(t)
         lay.addWidget(v)
         lay.addStretch(1)
 
     def set_value(self, value: str) -> None:
-        # second widget is value label
-        self.findChildren(QLabel)[1].setText(value)
+        self._value_label.setText(value)
+
+# All three cards in one round-trip. Fixed text, so the connection's statement
+# cache reuses the compiled plan; the alerts filter matches the partial index
+# idx_events_alerts_ts verbatim.
+COUNTS_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM tokens) AS tokens,
+        (SELECT COUNT(*) FROM events WHERE ts >= datetime('now', '-1 day')) AS events,
+        (SELECT COUNT(*) FROM events
+            WHERE ts >= datetime('now', '-1 day') AND severity IN ('high','medium')) AS alerts
+"""
+
+# Counts are reused while the DB is unchanged; the TTL only bounds how stale
+# the rolling 24h windows can get as old events age out.
+CACHE_TTL_SECONDS = 30.0
 
 class DashboardPage(QWidget):
+    # Startup page: must pick up daemon writes. Ticks are cheap, since refresh()
+    # only re-counts when the DB version changed (or the TTL ran out).
+    wants_polling = True
+
     def __init__(self) -> None:
         super().__init__()
+        # (db_version, monotonic_ts, tokens, events_24, alerts_24)
+        self._cache = None
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(4, 4, 4, 4)
         self.layout.setSpacing(12)
@@ -60,17 +82,30 @@ class DashboardPage(QWidget):
 
         self.layout.addStretch(1)
 
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
         self.refresh()
 
     def refresh(self) -> None:
-        tokens = q_one("SELECT COUNT(*) AS c FROM tokens")
-        events_24 = q_one("SELECT COUNT(*) AS c FROM events WHERE ts >= datetime('now', '-1 day')")
-        alerts_24 = q_one("""
-            SELECT COUNT(*) AS c FROM events
-            WHERE ts >= datetime('now', '-1 day')
-              AND severity IN ('high','medium')
-        """)
-
-        self.card_tokens.set_value(str(tokens["c"] if tokens else 0))
-        self.card_events.set_value(str(events_24["c"] if events_24 else 0))
-        self.card_alerts.set_value(str(alerts_24["c"] if alerts_24 else 0))
+        # Never hit the DB while another page is on screen.
+        if not self.isVisible():
+            return
+        version = get_db_version()
+        if self._cache is not None:
+            cached_version, ts, tokens_c, events_c, alerts_c = self._cache
+            if cached_version == version and time.monotonic() - ts < CACHE_TTL_SECONDS:
+                self._set_counts(tokens_c, events_c, alerts_c)
+                return
+
+        counts = q_one(COUNTS_SQL)
+        tokens_c = counts["tokens"] if counts else 0
+        events_c = counts["events"] if counts else 0
+        alerts_c = counts["alerts"] if counts else 0
+
+        self._cache = (version, time.monotonic(), tokens_c, events_c, alerts_c)
+        self._set_counts(tokens_c, events_c, alerts_c)
+
+    def _set_counts(self, tokens: int, events_24: int, alerts_24: int) -> None:
+        self.card_tokens.set_value(str(tokens))
+        self.card_events.set_value(str(events_24))
+        self.card_alerts.set_value(str(alerts_24))
@@ -1,6 +1,10 @@
 from __future__ import annotations
 from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex
 import sqlite3
+from operator import itemgetter
+
+from ...db import q_all
+from .row_diff import apply_rows_diff
 
 COLUMNS = [
     ("ts", "Time (UTC)"),
@@ -10,43 +14,177 @@ COLUMNS = [
     ("details", "Details"),
 ]
 
+# Flat lookups for the paint path: one tuple index per cell, no unpacking.
+_COL_KEYS = tuple(key for key, _ in COLUMNS)
+_COL_HEADERS = tuple(header for _, header in COLUMNS)
+# sqlite3.Row -> tuple in column order, done in C.
+_row_values = itemgetter(*_COL_KEYS)
+
+# Rows pulled per page; more are fetched as the view scrolls (fetchMore).
+PAGE_SIZE = 50
+
+_EVENTS_SELECT = """
+    SELECT e.id, e.ts, t.name AS token, e.event_type, e.severity, e.details
+    FROM events e
+    JOIN tokens t ON t.id = e.token_id
+"""
+
+_TS_COL = _COL_KEYS.index("ts")
+
+def query_events(limit: int, before: tuple[str, int] | None = None) -> list[sqlite3.Row]:
+    """
+    Newest-first events; `before` is a (ts, id) keyset cursor from the last loaded row.
+    """
+    if before is None:
+        return q_all(_EVENTS_SELECT + " ORDER BY e.ts DESC, e.id DESC LIMIT ?", (limit,))
+    return q_all(
+        _EVENTS_SELECT + " WHERE (e.ts, e.id) < (?, ?) ORDER BY e.ts DESC, e.id DESC LIMIT ?",
+        (*before, limit),
+    )
+
+def _unpack(rows: list[sqlite3.Row]) -> tuple[list[int], list[tuple]]:
+    return (
+        [r["id"] for r in rows],
+        [_row_values(r) for r in rows],
+    )
+
 class EventsModel(QAbstractTableModel):
+    """
+    Rows are stored as plain tuples in COLUMNS order (sqlite3.Row's by-name
+    lookup is slow on the paint path), with the row ids kept alongside in self.ids.
+    Display strings are memoized per (row, col) until the rows change.
+    Rows are loaded a page at a time: apply_reload() takes a re-query of what
+    is loaded (run off the GUI thread by the page, see reload_limit()),
+    fetchMore() appends the next page when the view scrolls to the end.
+    SQL already returns newest-first, so sort() does nothing for that order;
+    any other header sort is kept and re-applied as rows arrive.
+    """
     def __init__(self, rows: list[sqlite3.Row]) -> None:
         super().__init__()
-        self.rows: list[sqlite3.Row] = rows
+        self.ids, self.rows = _unpack(rows)
+        self._str_cache: dict[tuple[int, int], str] = {}
+        self._has_more = False
+        # (ts, id) of the oldest loaded event: the keyset cursor for fetchMore().
+        # Tracked from query results, never read off the (possibly re-sorted) rows.
+        self._cursor: tuple[str, int] | None = None
+        # View-requested (column, order), or None for the SQL order (newest first).
+        self._sort: tuple[int, Qt.SortOrder] | None = None
 
     def set_rows(self, rows: list[sqlite3.Row]) -> None:
         self.beginResetModel()
-        self.rows = rows
+        self.ids, self.rows = _unpack(rows)
+        self._str_cache.clear()
         self.endResetModel()
 
+    def set_rows_diff(self, rows: list[sqlite3.Row]) -> None:
+        """
+        Like set_rows, but only signals the rows that were added, removed,
+        moved or changed (rows are matched by "id").
+        """
+        ids, tuples = _unpack(rows)
+        if self._sort is not None:
+            ids, tuples = self._ordered(ids, tuples)
+        if ids == self.ids and tuples == self.rows:
+            return
+        # Positions shift during the diff; drop cached strings on both sides of it.
+        self._str_cache.clear()
+        apply_rows_diff(self, ids, tuples)
+        self._str_cache.clear()
+
+    def reload_limit(self) -> int:
+        """How many rows a reload re-queries: what is loaded, at least one page."""
+        return max(PAGE_SIZE, len(self.rows))
+
+    def apply_reload(self, rows: list[sqlite3.Row], limit: int) -> None:
+        """
+        Diff in the newest `limit` events (query_events(limit), run off-thread)
+        so the view keeps its place.
+        """
+        self.set_rows_diff(rows)
+        self._has_more = len(rows) == limit
+        self._cursor = (rows[-1]["ts"], rows[-1]["id"]) if rows else None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid() or self._cursor is None:
+            return
+        rows = query_events(PAGE_SIZE, before=self._cursor)
+        self._has_more = len(rows) == PAGE_SIZE
+        if not rows:
+            return
+        self._cursor = (rows[-1]["ts"], rows[-1]["id"])
+        ids, tuples = _unpack(rows)
+        # Ids must stay unique (the row diff and _resort key on them): never
+        # append an event that is already loaded, whatever the display order.
+        loaded = set(self.ids)
+        if not loaded.isdisjoint(ids):
+            keep = [n for n, i in enumerate(ids) if i not in loaded]
+            ids = [ids[n] for n in keep]
+            tuples = [tuples[n] for n in keep]
+            if not ids:
+                return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(ids) - 1)
+        self.ids.extend(ids)
+        self.rows.extend(tuples)
+        self.endInsertRows()
+        if self._sort is not None:
+            self._resort()
+
     def rowCount(self, parent=QModelIndex()) -> int:
         return len(self.rows)
 
     def columnCount(self, parent=QModelIndex()) -> int:
-        return len(COLUMNS)
+        return len(_COL_KEYS)
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
-        if not index.isValid():
+        # Views ask for many roles per cell; only DisplayRole carries data.
+        if role != Qt.DisplayRole or not index.isValid():
             return None
-        row = self.rows[index.row()]
-        key, _ = COLUMNS[index.column()]
-        if role == Qt.DisplayRole:
-            v = row[key]
-            return "" if v is None else str(v)
-        return None
+        pos = (index.row(), index.column())
+        text = self._str_cache.get(pos)
+        if text is None:
+            v = self.rows[pos[0]][pos[1]]
+            text = "" if v is None else str(v)
+            self._str_cache[pos] = text
+        return text
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
         if role != Qt.DisplayRole:
             return None
         if orientation == Qt.Horizontal:
-            return COLUMNS[section][1]
+            return _COL_HEADERS[section]
         return str(section + 1)
 
     def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
-        key, _ = COLUMNS[column]
+        # Newest-first is exactly what SQL returns: trust it, never re-sort for it.
+        sort = None if (column == _TS_COL and order == Qt.DescendingOrder) else (column, order)
+        if sort == self._sort:
+            return
+        self._sort = sort
+        self._resort()
+
+    def _ordered(self, ids: list[int], rows: list[tuple]) -> tuple[list[int], list[tuple]]:
+        if self._sort is None:
+            order_idx = sorted(range(len(rows)), key=lambda i: (rows[i][_TS_COL], ids[i]), reverse=True)
+        else:
+            column, order = self._sort
+            order_idx = sorted(range(len(rows)), key=lambda i: (rows[i][column] is None, rows[i][column]))
+            if order == Qt.DescendingOrder:
+                order_idx.reverse()
+        return [ids[i] for i in order_idx], [rows[i] for i in order_idx]
+
+    def _resort(self) -> None:
         self.layoutAboutToBeChanged.emit()
-        self.rows.sort(key=lambda r: (r[key] is None, r[key]))
-        if order == Qt.DescendingOrder:
-            self.rows.reverse()
+        old_ids = self.ids
+        self.ids, self.rows = self._ordered(self.ids, self.rows)
+        new_pos = {i: n for n, i in enumerate(self.ids)}
+        old_persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_persistent,
+            [self.index(new_pos[old_ids[p.row()]], p.column()) for p in old_persistent],
+        )
+        self._str_cache.clear()
         self.layoutChanged.emit()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+from typing import Hashable, Sequence
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+def apply_rows_diff(
+    model: QAbstractTableModel,
+    ids: Sequence[Hashable],
+    rows: Sequence[tuple],
+) -> None:
+    """
+    Update the model's parallel model.ids / model.rows lists to `ids` / `rows`
+    with fine-grained signals instead of a reset:
+    removed rows -> beginRemoveRows, reordered survivors -> layoutChanged,
+    new rows -> beginInsertRows, changed rows -> dataChanged.
+    Views keep selection, scroll position and unaffected cells.
+    """
+    new_ids = list(ids)
+    new_set = set(new_ids)
+
+    # 1) Drop rows that disappeared, bottom-up in contiguous runs.
+    r = len(model.ids) - 1
+    while r >= 0:
+        if model.ids[r] in new_set:
+            r -= 1
+            continue
+        end = r
+        while r >= 0 and model.ids[r] not in new_set:
+            r -= 1
+        model.beginRemoveRows(QModelIndex(), r + 1, end)
+        del model.ids[r + 1 : end + 1]
+        del model.rows[r + 1 : end + 1]
+        model.endRemoveRows()
+
+    # 2) Put surviving rows into the new order (only if it changed).
+    cur_ids = list(model.ids)
+    cur_set = set(cur_ids)
+    survivors = [i for i in new_ids if i in cur_set]
+    if survivors != cur_ids:
+        model.layoutAboutToBeChanged.emit()
+        old_pos = {i: n for n, i in enumerate(cur_ids)}
+        new_pos = {i: n for n, i in enumerate(survivors)}
+        model.rows = [model.rows[old_pos[i]] for i in survivors]
+        model.ids = survivors
+        old_persistent = model.persistentIndexList()
+        model.changePersistentIndexList(
+            old_persistent,
+            [model.index(new_pos[cur_ids[p.row()]], p.column()) for p in old_persistent],
+        )
+        model.layoutChanged.emit()
+
+    # 3) Walk the new list: insert runs of new rows, note changed ones.
+    last_col = model.columnCount() - 1
+    j = 0
+    while j < len(new_ids):
+        if j < len(model.ids) and model.ids[j] == new_ids[j]:
+            if model.rows[j] != rows[j]:
+                model.rows[j] = rows[j]
+                model.dataChanged.emit(model.index(j, 0), model.index(j, last_col), [Qt.DisplayRole])
+            j += 1
+            continue
+        start = j
+        while j < len(new_ids) and new_ids[j] not in cur_set:
+            j += 1
+        model.beginInsertRows(QModelIndex(), start, j - 1)
+        model.ids[start:start] = new_ids[start:j]
+        model.rows[start:start] = rows[start:j]
+        model.endInsertRows()
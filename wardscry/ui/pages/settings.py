@@ -5,6 +5,9 @@ from ..widgets import section_title, hint
 from ...config import load_config, save_config
 
 class SettingsPage(QWidget):
+    # Nothing here changes on its own; no timer ticks needed.
+    wants_polling = False
+
     def __init__(self) -> None:
         super().__init__()
         self.cfg = load_config()
@@ -59,7 +62,10 @@ class SettingsPage(QWidget):
         self.btn_save.clicked.connect(self.on_save)
 
     def refresh(self) -> None:
-        # Reload if external edits happen
+        # Reload if external edits happen; load_config() only re-parses the
+        # YAML when the file changed, so an idle tick costs one stat().
+        if not self.isVisible():
+            return
         self.cfg = load_config()
 
     def on_save(self) -> None:
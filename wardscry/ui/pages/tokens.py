@@ -1,24 +1,29 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QTimer, QItemSelectionModel
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QTableView,
     QMessageBox,
     QAbstractItemView,
 )
 
 from ...db import q_all
 from ...core import delete_token, reset_token_status
-from ..widgets import section_title, hint
+from ..widgets import section_title, hint, HeaderSizedTableView, REFRESH_DEBOUNCE_MS
 from ..dialogs.create_token import CreateTokenDialog
-from .tokens_model import TokensModel
+from .tokens_model import TokensModel, COLUMNS
+from .background import BackgroundQuery
+
+COLUMN_KEYS = [key for key, _ in COLUMNS]
 
 
 class TokensPage(QWidget):
+    # Token status flips when the daemon sees a touch.
+    wants_polling = True
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -46,17 +51,32 @@ class TokensPage(QWidget):
         lay.addLayout(btn_row)
 
         # Table
-        self.table = QTableView()
+        self.table = HeaderSizedTableView()
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self.table.setSortingEnabled(True)
-        self.table.horizontalHeader().setStretchLastSection(True)
+        # SQLite does the sorting (see refresh); the header only tracks the indicator.
+        self.table.setSortingEnabled(False)
+        header = self.table.horizontalHeader()
+        header.setStretchLastSection(True)
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
         lay.addWidget(self.table, 1)
 
         # Model
         self.model = TokensModel([])
         self.table.setModel(self.model)
-        self.table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        # Header-based widths, computed once; refreshes never re-measure.
+        self.table.resizeColumnsToContents()
+        header.setSortIndicator(COLUMN_KEYS.index("created_at"), Qt.SortOrder.DescendingOrder)
+        header.sortIndicatorChanged.connect(self.refresh)
+
+        # Button spam / timer ticks / post-action refreshes collapse into one query.
+        self._refresh_pending = QTimer(self)
+        self._refresh_pending.setSingleShot(True)
+        self._refresh_pending.setInterval(REFRESH_DEBOUNCE_MS)
+        self._refresh_pending.timeout.connect(self._do_refresh)
+        # SQLite runs on the DB worker thread; rows come back via a queued signal.
+        self._query = BackgroundQuery(self, self.model.set_rows_diff)
 
         # Signals
         self.btn_add.clicked.connect(self.on_add)
@@ -64,50 +84,37 @@ class TokensPage(QWidget):
         self.btn_reset.clicked.connect(self.on_reset)
         self.btn_refresh.clicked.connect(self.refresh)
 
-        self.refresh()
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._do_refresh()
 
     def refresh(self) -> None:
         """
-        Auto-called by MainWindow's QTimer.
-        Model resets clear selection, so we capture selected token id
-        and restore it after updating rows (next event loop tick).
+        Auto-called by MainWindow's QTimer and after every action.
+        Debounced: calls within REFRESH_DEBOUNCE_MS run one query.
         """
-        keep_id = self.selected_token_id()
+        self._refresh_pending.start()
 
-        rows = q_all(
-            """
-            SELECT id, name, path, template, sensitivity, status, created_at, last_event_at
-            FROM tokens
-            ORDER BY created_at DESC
-            """
-        )
-        self.model.set_rows(rows)
-
-        if keep_id is not None:
-            # Let Qt finish any pending sort/layout work, then restore selection
-            QTimer.singleShot(0, lambda: self._restore_selection(keep_id))
-
-    def _restore_selection(self, token_id: int) -> None:
-        sm = self.table.selectionModel()
-        if sm is None:
+    def _do_refresh(self) -> None:
+        """
+        No-op while hidden. Rows are diffed into the model, so selection
+        and scroll position survive the refresh.
+        """
+        self._refresh_pending.stop()
+        if not self.isVisible():
             return
 
-        for r, rec in enumerate(getattr(self.model, "rows", [])):
-            try:
-                if int(rec["id"]) != token_id:
-                    continue
-            except Exception:
-                continue
-
-            idx = self.model.index(r, 0)
-            flags = (
-                QItemSelectionModel.SelectionFlag.ClearAndSelect
-                | QItemSelectionModel.SelectionFlag.Rows
-            )
-            sm.select(idx, flags)
-            self.table.setCurrentIndex(idx)
-            self.table.scrollTo(idx)
-            return
+        header = self.table.horizontalHeader()
+        # Column names come from COLUMNS, never from user input.
+        col = COLUMN_KEYS[header.sortIndicatorSection()]
+        direction = "DESC" if header.sortIndicatorOrder() == Qt.SortOrder.DescendingOrder else "ASC"
+
+        sql = f"""
+            SELECT id, name, path, template, sensitivity, status, created_at, last_event_at
+            FROM tokens
+            ORDER BY {col} IS NULL {direction}, {col} {direction}, id {direction}
+        """
+        self._query.submit(q_all, sql)
 
     def selected_token_id(self) -> int | None:
         sm = self.table.selectionModel()
@@ -120,7 +127,7 @@ class TokensPage(QWidget):
 
         row = idxs[0].row()
         try:
-            return int(self.model.rows[row]["id"])
+            return int(self.model.ids[row])
         except Exception:
             return None
 
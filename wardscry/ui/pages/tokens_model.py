@@ -1,6 +1,9 @@
 from __future__ import annotations
 from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex
 import sqlite3
+from operator import itemgetter
+
+from .row_diff import apply_rows_diff
 
 COLUMNS = [
     ("name", "Name"),
@@ -12,43 +15,69 @@ COLUMNS = [
     ("last_event_at", "Last event"),
 ]
 
+# Flat lookups for the paint path: one tuple index per cell, no unpacking.
+_COL_KEYS = tuple(key for key, _ in COLUMNS)
+_COL_HEADERS = tuple(header for _, header in COLUMNS)
+# sqlite3.Row -> tuple in column order, done in C.
+_row_values = itemgetter(*_COL_KEYS)
+
+def _unpack(rows: list[sqlite3.Row]) -> tuple[list[int], list[tuple]]:
+    return (
+        [r["id"] for r in rows],
+        [_row_values(r) for r in rows],
+    )
+
 class TokensModel(QAbstractTableModel):
+    """
+    Rows are stored as plain tuples in COLUMNS order (sqlite3.Row's by-name
+    lookup is slow on the paint path), with the row ids kept alongside in self.ids.
+    Display strings are memoized per (row, col) until the rows change.
+    """
     def __init__(self, rows: list[sqlite3.Row]) -> None:
         super().__init__()
-        self.rows: list[sqlite3.Row] = rows
+        self.ids, self.rows = _unpack(rows)
+        self._str_cache: dict[tuple[int, int], str] = {}
 
     def set_rows(self, rows: list[sqlite3.Row]) -> None:
         self.beginResetModel()
-        self.rows = rows
+        self.ids, self.rows = _unpack(rows)
+        self._str_cache.clear()
         self.endResetModel()
 
+    def set_rows_diff(self, rows: list[sqlite3.Row]) -> None:
+        """
+        Like set_rows, but only signals the rows that were added, removed,
+        moved or changed (rows are matched by "id").
+        """
+        ids, tuples = _unpack(rows)
+        if ids == self.ids and tuples == self.rows:
+            return
+        # Positions shift during the diff; drop cached strings on both sides of it.
+        self._str_cache.clear()
+        apply_rows_diff(self, ids, tuples)
+        self._str_cache.clear()
+
     def rowCount(self, parent=QModelIndex()) -> int:
         return len(self.rows)
 
     def columnCount(self, parent=QModelIndex()) -> int:
-        return len(COLUMNS)
+        return len(_COL_KEYS)
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
-        if not index.isValid():
+        # Views ask for many roles per cell; only DisplayRole carries data.
+        if role != Qt.DisplayRole or not index.isValid():
             return None
-        row = self.rows[index.row()]
-        key, _ = COLUMNS[index.column()]
-        if role == Qt.DisplayRole:
-            v = row[key]
-            return "" if v is None else str(v)
-        return None
+        pos = (index.row(), index.column())
+        text = self._str_cache.get(pos)
+        if text is None:
+            v = self.rows[pos[0]][pos[1]]
+            text = "" if v is None else str(v)
+            self._str_cache[pos] = text
+        return text
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
         if role != Qt.DisplayRole:
             return None
         if orientation == Qt.Horizontal:
-            return COLUMNS[section][1]
+            return _COL_HEADERS[section]
         return str(section + 1)
-
-    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
-        key, _ = COLUMNS[column]
-        self.layoutAboutToBeChanged.emit()
-        self.rows.sort(key=lambda r: (r[key] is None, r[key]))
-        if order == Qt.DescendingOrder:
-            self.rows.reverse()
-        self.layoutChanged.emit()
@@ -1,5 +1,14 @@
 from __future__ import annotations
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QTableView, QHeaderView
+
+# Extra room around header text (sort indicator + margins), and a floor (Qt's
+# default section size) so short headers don't produce cramped columns.
+COLUMN_PADDING = 40
+COLUMN_MIN_WIDTH = 100
+
+# Window in which back-to-back refresh() calls collapse into one query.
+REFRESH_DEBOUNCE_MS = 150
 
 def section_title(text: str) -> QLabel:
     lbl = QLabel(text)
@@ -14,3 +23,21 @@ def hint(text: str) -> QLabel:
     lbl.setWordWrap(True)
     lbl.setStyleSheet("color: #666;")
     return lbl
+
+class HeaderSizedTableView(QTableView):
+    """
+    QTableView whose column size hints come from the header labels only.
+    Qt's default converts every row's cell to text to size a column; this
+    keeps sizing O(columns) no matter how many rows the model holds.
+    """
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+
+    def sizeHintForColumn(self, column: int) -> int:
+        model = self.model()
+        if model is None:
+            return COLUMN_MIN_WIDTH
+        label = model.headerData(column, Qt.Horizontal, Qt.DisplayRole) or ""
+        width = self.horizontalHeader().fontMetrics().horizontalAdvance(str(label))
+        return max(COLUMN_MIN_WIDTH, width + COLUMN_PADDING)